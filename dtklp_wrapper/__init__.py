@@ -1,3 +1,3 @@
 __version__ = "0.0.1"
 
-from .modules import ImageEngine, Lib, EngineParams
\ No newline at end of file
+from .modules import ImageEngine, Lib, EngineParams, Detection, result_scope, plate_scope
\ No newline at end of file
@@ -0,0 +1,107 @@
+# cython: language_level=3
+"""Compiled hot path for ImageEngine.process
+
+DTKLP functions are taken by address from already loaded library,
+so module doesn't need DTKLP headers or linking.
+"""
+
+from libc.stdint cimport uintptr_t
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+
+
+ctypedef void* (*read_from_mem_t)(void*, const void*, int) noexcept nogil
+ctypedef int (*get_plates_count_t)(void*) noexcept nogil
+ctypedef void* (*get_plate_t)(void*, int) noexcept nogil
+ctypedef int (*get_plate_text_t)(void*, char*, int) noexcept nogil
+ctypedef void (*destroy_t)(void*) noexcept nogil
+
+
+cdef inline bint _is_ascii(const char* text, int size) noexcept nogil:
+    cdef int i
+    for i in range(size):
+        if <unsigned char>text[i] >= 128:
+            return False
+    return True
+
+
+cdef class FastPath:
+    """Processes image with a single Python/C crossing"""
+
+    cdef read_from_mem_t read_from_mem
+    cdef get_plates_count_t get_plates_count
+    cdef get_plate_t get_plate
+    cdef get_plate_text_t get_plate_text
+    cdef destroy_t destroy_plate
+    cdef destroy_t destroy_result
+    cdef char* text_buf
+    cdef int buf_size
+
+    def __cinit__(self, uintptr_t read_from_mem, uintptr_t get_plates_count,
+                  uintptr_t get_plate, uintptr_t get_plate_text,
+                  uintptr_t destroy_plate, uintptr_t destroy_result, int buf_size):
+        """Binds DTKLP functions
+
+            Parameters:
+                read_from_mem .. destroy_result: addresses of DTKLP functions
+                buf_size: size of buffer for plate text
+        """
+
+        self.read_from_mem = <read_from_mem_t>read_from_mem
+        self.get_plates_count = <get_plates_count_t>get_plates_count
+        self.get_plate = <get_plate_t>get_plate
+        self.get_plate_text = <get_plate_text_t>get_plate_text
+        self.destroy_plate = <destroy_t>destroy_plate
+        self.destroy_result = <destroy_t>destroy_result
+        self.text_buf = <char*>PyMem_Malloc(buf_size)
+        if self.text_buf == NULL:
+            raise MemoryError()
+        self.buf_size = buf_size
+
+    def __dealloc__(self):
+        PyMem_Free(self.text_buf)
+
+    def process(self, uintptr_t engine, const unsigned char[::1] buffer, list out, bint decode=True):
+        """Process image bytes
+
+            Parameters:
+                engine: LPREngine object
+                buffer: image bytes
+                out: list which will be cleared and filled with plates
+                decode: if False plates are left as raw bytes
+            Returns:
+                int: detected count
+        """
+
+        cdef const unsigned char* data = NULL
+        cdef void* result
+        cdef void* plate
+        cdef int count, i, written
+        cdef int size = <int>buffer.shape[0]
+
+        if buffer.shape[0] > 0:
+            data = &buffer[0]
+        # Recognition doesn't touch Python objects, let other threads run
+        with nogil:
+            result = self.read_from_mem(<void*>engine, data, size)
+        try:
+            # Library result is not trusted, negative count means nothing found
+            count = max(self.get_plates_count(result), 0)
+            out.clear()
+            for i in range(count):
+                plate = self.get_plate(result, i)
+                try:
+                    written = self.get_plate_text(plate, self.text_buf, self.buf_size)
+                    # Library result is not trusted, never read outside of buffer
+                    written = min(max(written, 0), self.buf_size)
+                    # Plates are almost always ASCII, its decoder is the fastest
+                    if not decode:
+                        out.append(self.text_buf[:written])
+                    elif _is_ascii(self.text_buf, written):
+                        out.append(self.text_buf[:written].decode("ascii"))
+                    else:
+                        out.append(self.text_buf[:written].decode("utf-8", "replace"))
+                finally:
+                    self.destroy_plate(plate)
+        finally:
+            self.destroy_result(result)
+        return count
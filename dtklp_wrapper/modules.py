@@ -1,21 +1,137 @@
 import ctypes as ct
 import os
+import warnings
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import cffi
+except ImportError:
+    cffi = None
+
+# Recognizes cffi callbacks passed to ctypes backend
+_CFFI = cffi.FFI() if cffi is not None else None
+
+try:
+    from ._fast import FastPath
+except ImportError:
+    FastPath = None
+
+
+# C declarations of used DTKLP functions for cffi backend
+_CDEF = """
+    void* LPRParams_Create(void);
+    void LPRParams_Destroy(void* params);
+    void* LPREngine_Create(void* params, int video, void* callback);
+    void LPREngine_Destroy(void* engine);
+    void* LPREngine_ReadFromMemFile(void* engine, void* buffer, int size);
+    int LPREngine_IsLicensed(void* engine);
+    int LPREngine_ActivateLicenseOnline(const char* key);
+    void LPRResult_Destroy(void* result);
+    int LPRResult_GetPlatesCount(void* result);
+    void* LPRResult_GetPlate(void* result, int index);
+    void LicensePlate_Destroy(void* plate);
+    int LicensePlate_GetText(void* plate, char* buffer, int size);
+"""
+
+# Processing result, use ._asdict() if dict is needed
+Detection = namedtuple("Detection", ["found", "plates"])
+
+
+def _byte_view(buffer) -> memoryview:
+    """Returns flat byte view of image buffer, non-contiguous one is copied once"""
+
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        view = memoryview(bytearray(view))
+    return view.cast("B")
 
 
 class Lib:
     """Wraps over DTKLP library"""
 
-    def __init__(self, lib_path: str, buffer_size: int):
+    __slots__ = (
+        "lib", "backend", "BUF_SIZE", "_ffi", "_string_at",
+        "_create_params", "_destroy_params", "_create_engine", "_destroy_engine",
+        "_read_from_mem", "_engine_licensed", "_activate_online", "_destroy_result",
+        "_get_plates_count", "_get_plate", "_destroy_plate", "_get_plate_text",
+    )
+
+    def __init__(self, lib_path: str, buffer_size: int, backend: str = "ctypes"):
         """Init library with settings
             
             Parameters:
                 lib_path: path to .dll, .so etc
                 buffer_size: size of buffer which used for transfer data
+                backend: "ctypes" or "cffi", cffi passes image buffers without copy
         """
         
-        self.lib = ct.CDLL(lib_path)
+        if backend == "ctypes":
+            self._ffi = None
+            self.lib = ct.CDLL(lib_path)
+            self._declare_prototypes()
+            self._string_at = ct.string_at
+        elif backend == "cffi":
+            if cffi is None:
+                raise ImportError("cffi backend requires cffi package")
+            self._ffi = cffi.FFI()
+            self._ffi.cdef(_CDEF)
+            self.lib = self._ffi.dlopen(lib_path)
+            self._string_at = self._ffi.unpack
+        else:
+            raise ValueError("Unknown backend: {}".format(backend))
+        self.backend = backend
         self.BUF_SIZE = buffer_size
-    
+        self._bind_functions()
+
+    def _declare_prototypes(self):
+        """Declares C signatures once, so ctypes doesn't infer them on every call
+            and handles are not truncated to int on 64-bit platforms
+        """
+
+        lib = self.lib
+        lib.LPRParams_Create.argtypes = []
+        lib.LPRParams_Create.restype = ct.c_void_p
+        lib.LPRParams_Destroy.argtypes = [ct.c_void_p]
+        lib.LPRParams_Destroy.restype = None
+        lib.LPREngine_Create.argtypes = [ct.c_void_p, ct.c_int, ct.c_void_p]
+        lib.LPREngine_Create.restype = ct.c_void_p
+        lib.LPREngine_Destroy.argtypes = [ct.c_void_p]
+        lib.LPREngine_Destroy.restype = None
+        lib.LPREngine_ReadFromMemFile.argtypes = [ct.c_void_p, ct.POINTER(ct.c_ubyte), ct.c_int]
+        lib.LPREngine_ReadFromMemFile.restype = ct.c_void_p
+        lib.LPREngine_IsLicensed.argtypes = [ct.c_void_p]
+        lib.LPREngine_IsLicensed.restype = ct.c_int
+        lib.LPREngine_ActivateLicenseOnline.argtypes = [ct.c_char_p]
+        lib.LPREngine_ActivateLicenseOnline.restype = ct.c_int
+        lib.LPRResult_Destroy.argtypes = [ct.c_void_p]
+        lib.LPRResult_Destroy.restype = None
+        lib.LPRResult_GetPlatesCount.argtypes = [ct.c_void_p]
+        lib.LPRResult_GetPlatesCount.restype = ct.c_int
+        lib.LPRResult_GetPlate.argtypes = [ct.c_void_p, ct.c_int]
+        lib.LPRResult_GetPlate.restype = ct.c_void_p
+        lib.LicensePlate_Destroy.argtypes = [ct.c_void_p]
+        lib.LicensePlate_Destroy.restype = None
+        lib.LicensePlate_GetText.argtypes = [ct.c_void_p, ct.c_char_p, ct.c_int]
+        lib.LicensePlate_GetText.restype = ct.c_int
+
+    def _bind_functions(self):
+        """Stores C functions as attributes to skip CDLL lookup on every call"""
+
+        lib = self.lib
+        self._create_params = lib.LPRParams_Create
+        self._destroy_params = lib.LPRParams_Destroy
+        self._create_engine = lib.LPREngine_Create
+        self._destroy_engine = lib.LPREngine_Destroy
+        self._read_from_mem = lib.LPREngine_ReadFromMemFile
+        self._engine_licensed = lib.LPREngine_IsLicensed
+        self._activate_online = lib.LPREngine_ActivateLicenseOnline
+        self._destroy_result = lib.LPRResult_Destroy
+        self._get_plates_count = lib.LPRResult_GetPlatesCount
+        self._get_plate = lib.LPRResult_GetPlate
+        self._destroy_plate = lib.LicensePlate_Destroy
+        self._get_plate_text = lib.LicensePlate_GetText
+
     def create_params(self):
         """Creates LPRParams object
             
@@ -23,7 +139,7 @@ class Lib:
                 object: LPRParams
         """
 
-        return self.lib.LPRParams_Create()
+        return self._create_params()
     
     def destroy_params(self, params_obj):
         """Destroys LPRParams object
@@ -32,7 +148,7 @@ class Lib:
                 params_obj: LPRParams object
         """
         
-        self.lib.LPRParams_Destroy(params_obj)
+        self._destroy_params(params_obj)
 
     def create_engine(self, params_obj, vid_mode, callback):
         """Creates LPREngine object
@@ -40,12 +156,29 @@ class Lib:
             Parameters:
                 params_obj: LPRParams object
                 vid_mode: if True engine will accept only video, otherwise only images
-                callback: callback function pointer, used in video mode, for backend notification
+                callback: callback function pointer, used in video mode, for backend notification,
+                    ctypes CFUNCTYPE, cffi callback or numba.cfunc object with signature
+                    of LicensePlateDetectedCallback from DTKLP SDK.
+                    Caller keeps it alive while engine exists
             Returns:
                 object: LPREngine
         """
         
-        return self.lib.LPREngine_Create(params_obj, vid_mode, callback)
+        if hasattr(callback, "address"):
+            # numba.cfunc, pass native pointer so events don't go through Python
+            callback = callback.address
+        elif self._ffi is None and _CFFI is not None and isinstance(callback, _CFFI.CData):
+            # cffi callback, ctypes accepts only its address
+            callback = int(_CFFI.cast("uintptr_t", callback))
+        if self._ffi is not None:
+            if callback is None:
+                callback = self._ffi.NULL
+            else:
+                if not isinstance(callback, (int, self._ffi.CData)):
+                    # ctypes function pointer
+                    callback = ct.cast(callback, ct.c_void_p).value
+                callback = self._ffi.cast("void*", callback)
+        return self._create_engine(params_obj, vid_mode, callback)
     
     def destroy_engine(self, enigne_obj):
         """Destroys LPREngine object
@@ -54,21 +187,51 @@ class Lib:
                 enigne_obj: LPREngine object
         """
         
-        self.lib.LPREngine_Destroy(enigne_obj)
+        self._destroy_engine(enigne_obj)
 
     def read_from_mem(self, engine_obj, buffer):
         """Process image bytes
 
             Parameters:
                 engine_obj: LPREngine object
-                buffer: image bytes
+                buffer: image bytes, any bytes-like object (writable ones are passed without copy)
             Returns:
                 object: LPRResult
         """
         
-        ba = bytearray(buffer)
-        data = ct.create_string_buffer(bytes(ba), len(ba))
-        return self.lib.LPREngine_ReadFromMemFile(engine_obj, data, len(ba))
+        data, size = self._input_buffer(buffer)
+        return self._read_from_mem(engine_obj, data, size)
+
+    def read_from_mem_batch(self, engine_obj, buffers):
+        """Process several images lazily, one image per step
+
+            Parameters:
+                engine_obj: LPREngine object
+                buffers: iterable of image bytes
+            Returns:
+                iterator: LPRResult objects, caller destroys each before taking next
+        """
+
+        input_buffer = self._input_buffer
+        read_from_mem = self._read_from_mem
+        for buffer in buffers:
+            data, size = input_buffer(buffer)
+            yield read_from_mem(engine_obj, data, size)
+
+    def _input_buffer(self, buffer):
+        """Returns image data suitable for ReadFromMemFile and its size"""
+
+        view = _byte_view(buffer)
+        if self._ffi is not None:
+            data = self._ffi.from_buffer(view)
+            return data, len(data)
+
+        data_type = ct.c_ubyte * view.nbytes
+        if view.readonly:
+            data = data_type.from_buffer_copy(view)
+        else:
+            data = data_type.from_buffer(view)
+        return data, view.nbytes
     
     def destroy_result(self, result_obj):
         """Destroys LPRResult object
@@ -77,7 +240,7 @@ class Lib:
                 result_obj: LPRResult object
         """
 
-        self.lib.LPRResult_Destroy(result_obj)
+        self._destroy_result(result_obj)
     
     def get_plates_count(self, result_obj):
         """Returns detected license plates count
@@ -88,7 +251,7 @@ class Lib:
                 int: detected count
         """
 
-        return self.lib.LPRResult_GetPlatesCount(result_obj)
+        return self._get_plates_count(result_obj)
     
     def get_plate(self, result_obj, index: int):
         """Returns LicensePlate object
@@ -100,7 +263,7 @@ class Lib:
                 object: LicensePlate
         """
 
-        return self.lib.LPRResult_GetPlate(result_obj, index)
+        return self._get_plate(result_obj, index)
     
     def destroy_plate(self, plate_obj):
         """Destroys LicensePlate object
@@ -109,20 +272,74 @@ class Lib:
                 plate_obj: LicensePlate object
         """
 
-        self.lib.LicensePlate_Destroy(plate_obj)
+        self._destroy_plate(plate_obj)
     
-    def get_plate_text(self, plate_obj):
+    def create_text_buffer(self):
+        """Creates buffer for plate text, can be reused between calls
+
+            Returns:
+                object: char array of BUF_SIZE
+        """
+
+        if self._ffi is not None:
+            return self._ffi.new("char[]", self.BUF_SIZE)
+        return (ct.c_char * self.BUF_SIZE)()
+
+    def create_fast_path(self):
+        """Creates compiled processor bound to library functions
+
+            Returns:
+                object: FastPath, None if extension isn't built or backend is not ctypes
+        """
+
+        if FastPath is None or self._ffi is not None:
+            return None
+
+        def address(func):
+            return ct.cast(func, ct.c_void_p).value
+
+        return FastPath(
+            address(self._read_from_mem),
+            address(self._get_plates_count),
+            address(self._get_plate),
+            address(self._get_plate_text),
+            address(self._destroy_plate),
+            address(self._destroy_result),
+            self.BUF_SIZE
+        )
+
+    def get_plate_text(self, plate_obj, buffer=None):
         """Returns LicensePlate detected number
 
             Parameters:
                 plate_obj: LicensePlate object
+                buffer: buffer from create_text_buffer, new one is created if None
             Returns:
                 str: number text
         """
 
-        data = ct.create_string_buffer(self.BUF_SIZE)
-        writen = self.lib.LicensePlate_GetText(plate_obj, data, self.BUF_SIZE)
-        return str(data.value[0:writen])
+        text = self.get_plate_text_bytes(plate_obj, buffer)
+        # Plates are almost always ASCII, its decoder is the fastest
+        try:
+            return text.decode("ascii")
+        except UnicodeDecodeError:
+            return text.decode("utf-8", "replace")
+
+    def get_plate_text_bytes(self, plate_obj, buffer=None):
+        """Returns LicensePlate detected number without decoding
+
+            Parameters:
+                plate_obj: LicensePlate object
+                buffer: buffer from create_text_buffer, new one is created if None
+            Returns:
+                bytes: number text as returned by library
+        """
+
+        data = buffer if buffer is not None else self.create_text_buffer()
+        written = self._get_plate_text(plate_obj, data, self.BUF_SIZE)
+        # Library result is not trusted, never read outside of buffer
+        written = min(max(written, 0), self.BUF_SIZE)
+        return self._string_at(data, written)
     
     def engine_licensed(self, engine_obj):
         """Check license for LPREngine
@@ -133,25 +350,28 @@ class Lib:
                 int: 0 is ok, otherwise error code
         """
 
-        return self.lib.LPREngine_IsLicensed(engine_obj)
+        return self._engine_licensed(engine_obj)
     
     def activate_online(self, key: str):
         """Trying activate license with key
 
             Parameters:
-                key: license key
+                key: license key, str or already encoded bytes
             Returns:
                 int: 0 is success, otherwise error code
         """
 
-        ba = bytearray(key.encode())
-        data = ct.create_string_buffer(bytes(ba), len(ba))
-        return self.lib.LPREngine_ActivateLicenseOnline(data)
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        # c_char_p / const char* take bytes as is, no intermediate buffer
+        return self._activate_online(key)
 
 
 class EngineParams:
     """Wraps over LPRParams object"""
 
+    __slots__ = ("lib", "obj")
+
     def __init__(self, lib: Lib):
         """Binds lib with object
 
@@ -173,7 +393,14 @@ class EngineParams:
 
 
 class ImageEngine:
-    """Wraps over LPREngine object"""
+    """Wraps over LPREngine object
+
+        GIL is released while library recognizes image, so separate engines
+        can process frames from different threads concurrently.
+        One engine must not be used from several threads at once.
+    """
+
+    __slots__ = ("lib", "params", "obj", "_text_buf", "_fast")
 
     def __init__(self, lib, params: EngineParams = None):
         """Binds lib and params with object
@@ -193,6 +420,8 @@ class ImageEngine:
             self.params = EngineParams(self.lib)
         with self.params as ep:
             self.obj = self.lib.create_engine(ep, False, None)
+        self._text_buf = self.lib.create_text_buffer()
+        self._fast = self.lib.create_fast_path()
         return self
     
     def __exit__(self, exc_type, exc_value, traceback):
@@ -222,33 +451,154 @@ class ImageEngine:
         res = self.lib.activate_online(key)
         return res == 0
 
-    def process(self, bytes):
+    def process(self, bytes, decode: bool = True, out: list = None):
         """Process image bytes
 
             Parameters:
-                bytes: image bytes
+                bytes: image bytes, writable buffer (bytearray, memoryview of it,
+                    numpy array) is passed to library without copy, so frame
+                    buffer can be allocated once and reused
+                decode: if False plates are returned as raw bytes
+                out: list to clear and fill with plates instead of a new one,
+                    lets video loop reuse it, returned Detection shares it
+            Returns:
+                Detection: (found: int, plates: [str,])
+        """
+
+        plates = [] if out is None else out
+        if self._fast is not None:
+            found = self._fast.process(self.obj, _byte_view(bytes),
+                                       plates, decode)
+            return Detection(found, plates)
+
+        # try/finally instead of Result context manager, it's called per frame
+        result_obj = self.lib.read_from_mem(self.obj, bytes)
+        try:
+            found = _read_plates(self.lib, result_obj, self._text_buf, plates, decode)
+        finally:
+            self.lib._destroy_result(result_obj)
+        return Detection(found, plates)
+
+    def process_batch(self, images, decode: bool = True):
+        """Process several images
+
+            Parameters:
+                images: iterable of image bytes
+                decode: if False plates are returned as raw bytes
             Returns:
-                dict: {"found": int, "plates": [str,]}
+                list: Detection per image, each with own plates list
         """
 
-        res = Result(self.lib.read_from_mem(bytes), self.lib)
-        with res:
-            return res.describe()
+        detections = []
+        if self._fast is not None:
+            fast_process = self._fast.process
+            for image in images:
+                plates = []
+                found = fast_process(self.obj, _byte_view(image), plates, decode)
+                detections.append(Detection(found, plates))
+            return detections
+
+        # Streams images, only one input and LPRResult are alive at a time
+        lib = self.lib
+        buf = self._text_buf
+        destroy_result = lib._destroy_result
+        for result_obj in lib.read_from_mem_batch(self.obj, images):
+            try:
+                plates = []
+                found = _read_plates(lib, result_obj, buf, plates, decode)
+            finally:
+                destroy_result(result_obj)
+            detections.append(Detection(found, plates))
+        return detections
 
     
+def _read_plates(lib: Lib, result_obj, buf, plates: list, decode: bool = True):
+    """Reads texts of all plates from LPRResult object
+
+        Calls C functions directly, Plate per item costs more than the calls
+
+        Parameters:
+            lib: Lib object
+            result_obj: LPRResult object
+            buf: buffer from Lib.create_text_buffer
+            plates: list which will be cleared and filled with plates
+            decode: if False plates are left as raw bytes
+        Returns:
+            int: detected count
+    """
+
+    # Library result is not trusted, negative count means nothing found
+    count = max(lib._get_plates_count(result_obj), 0)
+    # Resize in place, reused list keeps its storage when count doesn't grow
+    del plates[count:]
+    plates.extend([None] * (count - len(plates)))
+    for i in range(count):
+        plate_obj = lib._get_plate(result_obj, i)
+        try:
+            written = lib._get_plate_text(plate_obj, buf, lib.BUF_SIZE)
+            written = min(max(written, 0), lib.BUF_SIZE)
+            text = lib._string_at(buf, written)
+            if decode:
+                # Plates are almost always ASCII, its decoder is the fastest
+                try:
+                    text = text.decode("ascii")
+                except UnicodeDecodeError:
+                    text = text.decode("utf-8", "replace")
+            plates[i] = text
+        finally:
+            lib._destroy_plate(plate_obj)
+    return count
+
+
+@contextmanager
+def result_scope(lib: Lib, result_obj):
+    """Destroys LPRResult object on exit, lighter than Result for raw handles
+
+        Parameters:
+            lib: Lib object
+            result_obj: LPRResult object
+    """
+
+    try:
+        yield result_obj
+    finally:
+        lib.destroy_result(result_obj)
+
+
+@contextmanager
+def plate_scope(lib: Lib, plate_obj):
+    """Destroys LicensePlate object on exit, replaces deprecated Plate
+
+        Parameters:
+            lib: Lib object
+            plate_obj: LicensePlate object
+    """
+
+    try:
+        yield plate_obj
+    finally:
+        lib.destroy_plate(plate_obj)
+
+
 class Result():
     """Wraps over LPRResult object"""
 
-    def __init__(self, obj, lib: Lib):
+    __slots__ = ("obj", "lib", "text_buf", "out_list", "plates_count", "plates")
+
+    def __init__(self, obj, lib: Lib, text_buf=None, out_list=None):
         """Binds lib and LPRResult object
         
             Parameters:
                 obj: LPRResult object
                 lib: Lib object
+                text_buf: buffer from Lib.create_text_buffer, shared by plates
+                out_list: list which will be cleared and filled with plates
         """
 
         self.obj = obj
         self.lib = lib
+        self.text_buf = text_buf
+        self.out_list = out_list
 
     def __enter__(self):
         """Loads data about LPRResult"""
@@ -262,38 +612,41 @@ class Result():
         self.lib.destroy_result(self.obj)
 
     def _load(self):
-        self.plates_count = self.lib.get_plates_count(self.obj)
-        self.plates = []
-        for i in range(self.plates_count):
-            with Plate(self.lib.get_plate(self.obj, i), self.lib) as pl:
-                self.plates.append(pl.describe())
+        buf = self.text_buf if self.text_buf is not None else self.lib.create_text_buffer()
+        self.plates = [] if self.out_list is None else self.out_list
+        self.plates_count = _read_plates(self.lib, self.obj, buf, self.plates)
     
     def describe(self):
         """Returns description
 
             Returns:
-                dict: {"found": int, "plates": [str,]}
+                Detection: (found: int, plates: [str,])
         """
 
-        return {
-            "found": self.plates_count,
-            "plates": self.plates
-        }
+        return Detection(self.plates_count, self.plates)
     
 
 class Plate():
-    """Wraps over LicensePlate object"""
+    """Wraps over LicensePlate object
+
+        Deprecated: kept for backward compatibility, use Lib.get_plate_text with plate_scope
+    """
+
+    __slots__ = ("obj", "lib", "text_buf", "text")
 
-    def __init__(self, obj, lib: Lib):
+    def __init__(self, obj, lib: Lib, text_buf=None):
         """Binds object and lib
 
             Parameters:
                 obj: LicansePlate object
                 lib: Lib object
+                text_buf: buffer from Lib.create_text_buffer
         """
 
+        warnings.warn("Plate is deprecated, use Lib.get_plate_text with plate_scope", DeprecationWarning, stacklevel=2)
         self.obj = obj
         self.lib = lib
+        self.text_buf = text_buf
 
     def __enter__(self):
         """Loads data about LicensePlate object"""
@@ -307,7 +660,7 @@ class Plate():
         self.lib.destroy_plate(self.obj)
 
     def _load(self):
-        self.text = self.lib.get_plate_text(self.obj)
+        self.text = self.lib.get_plate_text(self.obj, self.text_buf)
 
     def describe(self):
         """Returns description
@@ -1,5 +1,17 @@
 import setuptools
 
+# Compiled fast path is built only if Cython>=0.29.31 is installed,
+# package falls back to pure Python when extension is missing
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(["dtklp_wrapper/_fast.pyx"], language_level=3)
+    # cythonize recreates extensions, so compile failures are allowed afterwards
+    for ext in ext_modules:
+        ext.optional = True
+
 with open("README.md") as file:
     read_me_description = file.read()
 
@@ -13,10 +25,14 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://git.pancir.it/egor.bakharev/DTKLP-wrapper",
     packages=['dtklp_wrapper'],
+    ext_modules=ext_modules,
+    extras_require={
+        "cffi": ["cffi>=1.9"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.5',
+    python_requires='>=3.8',
 )
\ No newline at end of file